@@ -74,7 +74,7 @@ def run_pipeline(python_file: str, config_path: str) -> None:
         config_path: Path to configuration YAML file.
     """
     module = source_utils.import_python_file(python_file)
-    config = yaml_utils.read_yaml(config_path)
+    config = yaml_utils.read_yaml_cached(config_path)
     PipelineConfigurationKeys.key_check(config)
 
     pipeline_name = config[PipelineConfigurationKeys.NAME]
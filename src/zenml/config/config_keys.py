@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import functools
 from typing import Any, Dict, List, Tuple
 
 
@@ -19,9 +20,13 @@ class ConfigKeys:
     """Class to validate dictionary configurations."""
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_keys(cls) -> Tuple[List[str], List[str]]:
         """Gets all the required and optional config keys for this class.
 
+        The keys are computed once per class and cached afterwards as they
+        are needed for every step when validating a pipeline configuration.
+
         Returns:
             A tuple (required, optional) which are lists of the
             required/optional keys for this class.
@@ -59,13 +64,13 @@ class ConfigKeys:
         required, optional = cls.get_keys()
 
         # Check for missing keys
-        missing_keys = [k for k in required if k not in config.keys()]
+        missing_keys = [k for k in required if k not in config]
         if missing_keys:
             raise ValueError(f"Missing key(s) {missing_keys} in {cls.__name__}")
 
         # Check for unknown keys
         unknown_keys = [
-            k for k in config.keys() if k not in required and k not in optional
+            k for k in config if k not in required and k not in optional
         ]
         if unknown_keys:
             raise ValueError(
@@ -30,6 +30,3 @@ class AirflowIntegration(Integration):
     def activate(cls):
         """Activates all classes required for the airflow integration."""
         from zenml.integrations.airflow import orchestrators  # noqa
-
-
-AirflowIntegration.check_installation()
@@ -30,6 +30,3 @@ class AWSIntegration(Integration):
         """Activates the integration."""
         from zenml.integrations.aws import secret_schemas  # noqa
         from zenml.integrations.aws import secrets_managers  # noqa
-
-
-AWSIntegration.check_installation()
@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, ClassVar, Dict, List
 
 import boto3 as boto3  # type: ignore
@@ -28,6 +29,8 @@ logger = get_logger(__name__)
 
 DEFAULT_AWS_REGION = "us-east-1"
 ZENML_SCHEMA_NAME = "zenml_schema_name"
+# Maximum number of concurrent requests when deleting all secrets
+MAX_PARALLEL_DELETE_REQUESTS = 16
 
 
 def jsonify_secret_contents(secret: BaseSecretSchema) -> str:
@@ -148,7 +151,20 @@ class AWSSecretsManager(BaseSecretsManager):
         Args:
             force: whether to force delete all secrets"""
         self._ensure_client_connected(self.region_name)
-        for secret_name in self.get_all_secret_keys():
+        secret_names = self.get_all_secret_keys()
+        if not secret_names:
+            return
+
+        def _delete_secret(secret_name: str) -> None:
             self.CLIENT.delete_secret(
                 SecretId=secret_name, ForceDeleteWithoutRecovery=force
             )
+
+        # Each deletion is a separate API request, so we run them concurrently
+        # instead of waiting for the responses one after another. boto3
+        # clients are thread-safe, so all threads share the same client.
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PARALLEL_DELETE_REQUESTS, len(secret_names))
+        ) as executor:
+            # consume the results to re-raise any exception from the threads
+            list(executor.map(_delete_secret, secret_names))
@@ -31,6 +31,3 @@ class AzureIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.azure import artifact_stores  # noqa
-
-
-AzureIntegration.check_installation()
@@ -29,6 +29,3 @@ class AzureMLIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.azureml import step_operators  # noqa
-
-
-AzureMLIntegration.check_installation()
@@ -24,6 +24,3 @@ class DashIntegration(Integration):
         "dash-cytoscape>=0.3.0",
         "dash-bootstrap-components>=1.0.1",
     ]
-
-
-DashIntegration.check_installation()
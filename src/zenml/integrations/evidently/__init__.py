@@ -31,6 +31,3 @@ class EvidentlyIntegration(Integration):
 
     NAME = EVIDENTLY
     REQUIREMENTS = ["evidently==v0.1.41.dev0"]
-
-
-EvidentlyIntegration.check_installation()
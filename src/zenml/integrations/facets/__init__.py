@@ -28,6 +28,3 @@ class FacetsIntegration(Integration):
 
     NAME = FACETS
     REQUIREMENTS = ["facets-overview>=1.0.0", "IPython"]
-
-
-FacetsIntegration.check_installation()
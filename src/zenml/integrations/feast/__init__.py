@@ -31,6 +31,3 @@ class FeastIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.feast import feature_stores  # noqa
-
-
-FeastIntegration.check_installation()
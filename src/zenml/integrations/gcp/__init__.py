@@ -31,6 +31,3 @@ class GcpIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.gcp import artifact_stores  # noqa
-
-
-GcpIntegration.check_installation()
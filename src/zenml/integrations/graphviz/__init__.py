@@ -21,6 +21,3 @@ class GraphvizIntegration(Integration):
     NAME = GRAPHVIZ
     REQUIREMENTS = ["graphviz>=0.17"]
     SYSTEM_REQUIREMENTS = {"graphviz": "dot"}
-
-
-GraphvizIntegration.check_installation()
@@ -12,9 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import shutil
-from typing import Any, Dict, List, Tuple, Type, cast
-
-import pkg_resources
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, cast
 
 from zenml.integrations.registry import integration_registry
 from zenml.logger import get_logger
@@ -45,9 +43,16 @@ class Integration(metaclass=IntegrationMeta):
 
     SYSTEM_REQUIREMENTS: Dict[str, str] = {}
 
+    # cached result of `check_installation()`, see `ensure_installed()`
+    _installed: ClassVar[Optional[bool]] = None
+
     @classmethod
     def check_installation(cls) -> bool:
         """Method to check whether the required packages are installed"""
+        # `pkg_resources` scans all installed distributions on import, so we
+        # only import it once an installation actually needs to be checked
+        import pkg_resources
+
         try:
             for requirement, command in cls.SYSTEM_REQUIREMENTS.items():
                 result = shutil.which(command)
@@ -81,6 +86,22 @@ class Integration(metaclass=IntegrationMeta):
             )
             return False
 
+    @classmethod
+    def ensure_installed(cls) -> bool:
+        """Checks whether the required packages are installed and caches
+        the result for subsequent calls.
+
+        Use `check_installation()` instead if the installed packages might
+        have changed since the last check.
+        """
+        # only consider the value cached for this class, not the one of a
+        # parent integration class
+        installed = cls.__dict__.get("_installed")
+        if installed is None:
+            installed = cls.check_installation()
+            cls._installed = installed
+        return installed
+
     @staticmethod
     def activate() -> None:
         """Abstract method to activate the integration"""
@@ -31,6 +31,3 @@ class KubeflowIntegration(Integration):
         """Activates all classes required for the airflow integration."""
         from zenml.integrations.kubeflow import metadata_stores  # noqa
         from zenml.integrations.kubeflow import orchestrators  # noqa
-
-
-KubeflowIntegration.check_installation()
@@ -115,11 +115,7 @@ class KubeflowMetadataStore(BaseMetadataStore):
     def kubernetes_context(self) -> str:
         """Returns the kubernetes context to the cluster where the Kubeflow
         Pipelines services are running."""
-        kubernetes_context = self.kfp_orchestrator.kubernetes_context
-
-        # will never happen, but mypy doesn't know that
-        assert kubernetes_context is not None
-        return kubernetes_context
+        return self.kfp_orchestrator.effective_kubernetes_context
 
     @property
     def root_directory(self) -> str:
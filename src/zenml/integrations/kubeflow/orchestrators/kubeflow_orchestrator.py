@@ -12,26 +12,20 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import functools
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 from uuid import UUID
 
-import kfp
-import urllib3
-from kfp_server_api.exceptions import ApiException
-from pydantic import root_validator
-
 import zenml.io.utils
 from zenml.artifact_stores import LocalArtifactStore
 from zenml.enums import StackComponentType
 from zenml.exceptions import ProvisioningError
 from zenml.integrations.constants import KUBEFLOW
 from zenml.integrations.kubeflow.orchestrators import local_deployment_utils
-from zenml.integrations.kubeflow.orchestrators.kubeflow_dag_runner import (
-    KubeflowDagRunner,
-    KubeflowDagRunnerConfig,
-)
 from zenml.integrations.kubeflow.orchestrators.local_deployment_utils import (
     KFP_VERSION,
 )
@@ -47,12 +41,22 @@ from zenml.utils import networking_utils
 from zenml.utils.source_utils import get_source_root_path
 
 if TYPE_CHECKING:
+    import kfp
+
     from zenml.pipelines.base_pipeline import BasePipeline
     from zenml.runtime_configuration import RuntimeConfiguration
 
 logger = get_logger(__name__)
 
 DEFAULT_KFP_UI_PORT = 8080
+# Maximum number of secrets that are fetched concurrently from the secrets
+# manager when building the docker image
+MAX_PARALLEL_SECRET_REQUESTS = 16
+# Maximum number of seconds to wait between two status requests when waiting
+# for a synchronous pipeline run to finish
+MAX_RUN_STATUS_POLLING_INTERVAL = 30
+# Statuses in which a KFP run won't change anymore
+KFP_RUN_FINAL_STATUSES = ("succeeded", "failed", "skipped", "error")
 
 
 @register_stack_component_class
@@ -85,7 +89,13 @@ class KubeflowOrchestrator(BaseOrchestrator):
     # Class Configuration
     FLAVOR: ClassVar[str] = KUBEFLOW
 
+    # private attributes
+    # repo digests of the images pushed in `prepare_pipeline_deployment(...)`
+    _pushed_image_digests: Dict[str, str] = {}
+    _root_directory: Optional[str] = None
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_k3d_cluster_name(uuid: UUID) -> str:
         """Returns the k3d cluster name corresponding to the orchestrator
         UUID."""
@@ -94,35 +104,23 @@ class KubeflowOrchestrator(BaseOrchestrator):
         return f"zenml-kubeflow-{str(uuid)[:8]}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_k3d_kubernetes_context(uuid: UUID) -> str:
         """Returns the name of the kubernetes context associated with the k3d
         cluster managed locally by ZenML corresponding to the orchestrator
         UUID."""
         return f"k3d-{KubeflowOrchestrator._get_k3d_cluster_name(uuid)}"
 
-    @root_validator
-    def set_default_kubernetes_context(
-        cls, values: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Pydantic root_validator that sets the default `kubernetes_context`
-        value to the value that is used to create the locally managed k3d
-        cluster, if not explicitly set.
-
-        Args:
-            values: Values passed to the object constructor
+    @property
+    def effective_kubernetes_context(self) -> str:
+        """Returns the kubernetes context in which pipelines are run.
 
-        Returns:
-            Values passed to the Pydantic constructor
+        This is the explicitly configured `kubernetes_context` or, if not set,
+        the context of the local k3d cluster managed by ZenML.
         """
-        if values.get("kubernetes_context"):
-            return values
-        # not likely, due to Pydantic validation, but mypy complains
-        assert "uuid" in values
-
-        values["kubernetes_context"] = cls._get_k3d_kubernetes_context(
-            values["uuid"]
+        return self.kubernetes_context or self._get_k3d_kubernetes_context(
+            self.uuid
         )
-        return values
 
     @property
     def validator(self) -> Optional[StackValidator]:
@@ -195,11 +193,16 @@ class KubeflowOrchestrator(BaseOrchestrator):
             custom_validation_function=_validate_local_requirements,
         )
 
-    def get_docker_image_name(self, pipeline_name: str) -> str:
-        """Returns the full docker image name including registry and tag."""
+    def get_docker_image_name(self, pipeline_name: str, stack: "Stack") -> str:
+        """Returns the full docker image name including registry and tag.
+
+        Args:
+            pipeline_name: Name of the pipeline for which to get the image name.
+            stack: The stack on which the pipeline will be run.
+        """
 
         base_image_name = f"zenml-kubeflow:{pipeline_name}"
-        container_registry = Repository().active_stack.container_registry
+        container_registry = stack.container_registry
 
         if container_registry:
             registry_uri = container_registry.uri.rstrip("/")
@@ -212,19 +215,22 @@ class KubeflowOrchestrator(BaseOrchestrator):
         """Returns `True` if the KFP orchestrator is running locally (i.e. in
         the local k3d cluster managed by ZenML).
         """
-        return self.kubernetes_context == self._get_k3d_kubernetes_context(
-            self.uuid
+        return (
+            self.effective_kubernetes_context
+            == self._get_k3d_kubernetes_context(self.uuid)
         )
 
     @property
     def root_directory(self) -> str:
         """Returns path to the root directory for all files concerning
         this orchestrator."""
-        return os.path.join(
-            zenml.io.utils.get_global_config_directory(),
-            "kubeflow",
-            str(self.uuid),
-        )
+        if not self._root_directory:
+            self._root_directory = os.path.join(
+                zenml.io.utils.get_global_config_directory(),
+                "kubeflow",
+                str(self.uuid),
+            )
+        return self._root_directory
 
     @property
     def pipeline_directory(self) -> str:
@@ -251,7 +257,7 @@ class KubeflowOrchestrator(BaseOrchestrator):
         # may result in problems when running the pipeline, because
         # the local components will not be available inside the
         # Kubeflow containers.
-        if self.kubernetes_context:
+        if not self.is_local:
             # go through all stack components and identify those that advertise
             # a local path where they persist information that they need to be
             # available when running pipelines.
@@ -270,9 +276,9 @@ class KubeflowOrchestrator(BaseOrchestrator):
                     stack_comp.TYPE.value,
                 )
 
-        image_name = self.get_docker_image_name(pipeline.name)
+        image_name = self.get_docker_image_name(pipeline.name, stack=stack)
 
-        requirements = {*stack.requirements(), *pipeline.requirements}
+        requirements = stack.requirements() | pipeline.requirements
 
         logger.debug("Kubeflow docker container requirements: %s", requirements)
 
@@ -283,12 +289,14 @@ class KubeflowOrchestrator(BaseOrchestrator):
             requirements=requirements,
             base_image=self.custom_docker_base_image_name,
             environment_vars=self._get_environment_vars_from_secrets(
-                pipeline.secrets
+                pipeline.secrets, stack=stack
             ),
         )
 
         if stack.container_registry:
-            push_docker_image(image_name)
+            digest = push_docker_image(image_name)
+            if digest:
+                self._pushed_image_digests[image_name] = digest
 
     def run_pipeline(
         self,
@@ -310,10 +318,20 @@ class KubeflowOrchestrator(BaseOrchestrator):
                 "orchestrator."
             )
 
+        from zenml.integrations.kubeflow.orchestrators.kubeflow_dag_runner import (
+            KubeflowDagRunner,
+            KubeflowDagRunnerConfig,
+        )
         from zenml.utils.docker_utils import get_image_digest
 
-        image_name = self.get_docker_image_name(pipeline.name)
-        image_name = get_image_digest(image_name) or image_name
+        image_name = self.get_docker_image_name(pipeline.name, stack=stack)
+        # use the digest of the image we just pushed if available, which saves
+        # an additional request to the docker daemon
+        image_name = (
+            self._pushed_image_digests.get(image_name)
+            or get_image_digest(image_name)
+            or image_name
+        )
 
         fileio.makedirs(self.pipeline_directory)
         pipeline_file_path = os.path.join(
@@ -352,14 +370,18 @@ class KubeflowOrchestrator(BaseOrchestrator):
             runtime_configuration: Runtime configuration of the pipeline run.
             enable_cache: Whether caching is enabled for this pipeline run.
         """
+        import kfp
+        import urllib3
+        from kfp_server_api.exceptions import ApiException
+
         try:
             logger.info(
                 "Running in kubernetes context '%s'.",
-                self.kubernetes_context,
+                self.effective_kubernetes_context,
             )
 
             # upload the pipeline to Kubeflow and start it
-            client = kfp.Client(kube_context=self.kubernetes_context)
+            client = kfp.Client(kube_context=self.effective_kubernetes_context)
             if runtime_configuration.schedule:
                 try:
                     experiment = client.get_experiment(pipeline_name)
@@ -408,8 +430,8 @@ class KubeflowOrchestrator(BaseOrchestrator):
                 if self.synchronous:
                     # TODO [ENG-698]: Allow configuration of the timeout as a
                     #  runtime option
-                    client.wait_for_run_completion(
-                        run_id=result.run_id, timeout=1200
+                    self._wait_for_run_completion(
+                        client=client, run_id=result.run_id, timeout=1200
                     )
         except urllib3.exceptions.HTTPError as error:
             logger.warning(
@@ -419,6 +441,51 @@ class KubeflowOrchestrator(BaseOrchestrator):
                 error,
             )
 
+    @staticmethod
+    def _wait_for_run_completion(
+        client: "kfp.Client", run_id: str, timeout: int
+    ) -> Any:
+        """Waits until a KFP run is finished.
+
+        The status of the run is polled with an exponentially increasing
+        interval so short runs return quickly and long runs don't put
+        unnecessary load on the KFP API server.
+
+        Args:
+            client: The KFP client to use for the status requests.
+            run_id: ID of the run to wait for.
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            The details of the finished run.
+
+        Raises:
+            TimeoutError: If the run didn't finish in the given time.
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            run_detail = client.get_run(run_id=run_id)
+            status = run_detail.run.status
+            if status and status.lower() in KFP_RUN_FINAL_STATUSES:
+                return run_detail
+
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                raise TimeoutError(
+                    f"Kubeflow pipelines run '{run_id}' didn't finish within "
+                    f"{timeout} seconds."
+                )
+
+            attempt += 1
+            time.sleep(
+                min(
+                    MAX_RUN_STATUS_POLLING_INTERVAL,
+                    1.5 ** attempt,
+                    remaining_time,
+                )
+            )
+
     @property
     def _pid_file_path(self) -> str:
         """Returns path to the daemon PID file."""
@@ -513,8 +580,11 @@ class KubeflowOrchestrator(BaseOrchestrator):
         """
         if not self.is_local:
             return True
-        return local_deployment_utils.k3d_cluster_exists(
-            cluster_name=self._k3d_cluster_name
+        return (
+            local_deployment_utils.k3d_cluster_status(
+                cluster_name=self._k3d_cluster_name
+            )
+            != "absent"
         )
 
     @property
@@ -526,8 +596,11 @@ class KubeflowOrchestrator(BaseOrchestrator):
         """
         if not self.is_local:
             return True
-        return local_deployment_utils.k3d_cluster_running(
-            cluster_name=self._k3d_cluster_name
+        return (
+            local_deployment_utils.k3d_cluster_status(
+                cluster_name=self._k3d_cluster_name
+            )
+            == "running"
         )
 
     @property
@@ -557,7 +630,8 @@ class KubeflowOrchestrator(BaseOrchestrator):
                 "Please install 'k3d' and 'kubectl' and try again."
             )
 
-        container_registry = Repository().active_stack.container_registry
+        active_stack = Repository().active_stack
+        container_registry = active_stack.container_registry
 
         # should not happen, because the stack validation takes care of this,
         # but just in case
@@ -587,16 +661,12 @@ class KubeflowOrchestrator(BaseOrchestrator):
                 registry_name=container_registry_name,
                 registry_config_path=self._k3d_registry_config_path,
             )
-            kubernetes_context = self.kubernetes_context
-
-            # will never happen, but mypy doesn't know that
-            assert kubernetes_context is not None
-
+            kubernetes_context = self.effective_kubernetes_context
             local_deployment_utils.deploy_kubeflow_pipelines(
                 kubernetes_context=kubernetes_context
             )
 
-            artifact_store = Repository().active_stack.artifact_store
+            artifact_store = active_stack.artifact_store
             if isinstance(artifact_store, LocalArtifactStore):
                 local_deployment_utils.add_hostpath_to_kubeflow_pipelines(
                     kubernetes_context=kubernetes_context,
@@ -639,11 +709,7 @@ class KubeflowOrchestrator(BaseOrchestrator):
                 "resources provisioned for local deployment."
             )
 
-        kubernetes_context = self.kubernetes_context
-
-        # will never happen, but mypy doesn't know that
-        assert kubernetes_context is not None
-
+        kubernetes_context = self.effective_kubernetes_context
         if self.is_local and not self.is_cluster_running:
             # don't resume any resources if using a remote KFP installation
             local_deployment_utils.start_k3d_cluster(
@@ -680,12 +746,13 @@ class KubeflowOrchestrator(BaseOrchestrator):
             )
 
     def _get_environment_vars_from_secrets(
-        self, secrets: List[str]
+        self, secrets: List[str], stack: "Stack"
     ) -> Dict[str, str]:
         """Get key-value pairs from list of secrets provided by the user.
 
         Args:
             secrets: List of secrets provided by the user.
+            stack: The stack from which to use the secrets manager.
 
         Returns:
             A dictionary of key-value pairs.
@@ -693,10 +760,19 @@ class KubeflowOrchestrator(BaseOrchestrator):
         Raises:
             ProvisioningError: If the stack has no secrets manager."""
         environment_vars: Dict[str, str] = {}
-        secret_manager = Repository().active_stack.secrets_manager
+        secret_manager = stack.secrets_manager
         if secrets and secret_manager:
-            for secret in secrets:
-                secret_schema = secret_manager.get_secret(secret)
+            # Fetching a secret usually requires a request to a remote secrets
+            # backend, so we fetch all secrets concurrently. `map` returns the
+            # results in the order of the input secrets, which makes sure that
+            # later secrets still overwrite values of earlier ones.
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_PARALLEL_SECRET_REQUESTS, len(secrets))
+            ) as executor:
+                secret_schemas = list(
+                    executor.map(secret_manager.get_secret, secrets)
+                )
+            for secret_schema in secret_schemas:
                 environment_vars.update(secret_schema.content)
         elif secrets and not secret_manager:
             raise ProvisioningError(
@@ -3,6 +3,9 @@ import shutil
 import subprocess
 import sys
 import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from typing_extensions import Literal
 
 import zenml.io.utils
 from zenml.io import fileio
@@ -14,6 +17,14 @@ KFP_VERSION = "1.8.1"
 # The version (e.g. v1.23.5) refers to a specific kubernetes release and is
 # fixed as KFP doesn't support the newest releases immediately.
 K3S_IMAGE_NAME = "rancher/k3s:v1.23.5-k3s1"
+# Number of seconds for which the output of `k3d cluster list` is reused.
+# Checking the cluster state usually happens multiple times in a row (e.g.
+# `is_running` -> `is_provisioned` -> `is_cluster_running`), so caching the
+# output for a short time avoids spawning additional `k3d` processes.
+K3D_CLUSTER_LIST_CACHE_TTL = 2.0
+
+# Tuple of the monotonic timestamp and the parsed `k3d cluster list` output
+_k3d_cluster_list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
 
 logger = get_logger(__name__)
 
@@ -47,30 +58,53 @@ def write_local_registry_yaml(
     yaml_utils.write_yaml(yaml_path, yaml_content)
 
 
-def k3d_cluster_exists(cluster_name: str) -> bool:
-    """Checks whether there exists a K3D cluster with the given name."""
-    output = subprocess.check_output(
-        ["k3d", "cluster", "list", "--output", "json"]
-    )
-    clusters = json.loads(output)
-    for cluster in clusters:
-        if cluster["name"] == cluster_name:
-            return True
-    return False
+def _list_k3d_clusters() -> List[Dict[str, Any]]:
+    """Returns the K3D clusters reported by `k3d cluster list`.
+
+    The output is cached for `K3D_CLUSTER_LIST_CACHE_TTL` seconds.
+    """
+    global _k3d_cluster_list_cache
 
+    now = time.monotonic()
+    if _k3d_cluster_list_cache:
+        timestamp, clusters = _k3d_cluster_list_cache
+        if now - timestamp < K3D_CLUSTER_LIST_CACHE_TTL:
+            return clusters
 
-def k3d_cluster_running(cluster_name: str) -> bool:
-    """Checks whether the K3D cluster with the given name is running."""
     output = subprocess.check_output(
         ["k3d", "cluster", "list", "--output", "json"]
     )
     clusters = json.loads(output)
-    for cluster in clusters:
+    _k3d_cluster_list_cache = (now, clusters)
+    return clusters
+
+
+def _invalidate_k3d_cluster_list_cache() -> None:
+    """Invalidates the cached `k3d cluster list` output."""
+    global _k3d_cluster_list_cache
+    _k3d_cluster_list_cache = None
+
+
+def k3d_cluster_status(
+    cluster_name: str,
+) -> Literal["absent", "stopped", "running"]:
+    """Returns the status of the K3D cluster with the given name.
+
+    Args:
+        cluster_name: Name of the cluster.
+
+    Returns:
+        `absent` if no cluster with the given name exists, `running` if all
+        servers of the cluster are running and `stopped` otherwise.
+    """
+    for cluster in _list_k3d_clusters():
         if cluster["name"] == cluster_name:
             server_count: int = cluster["serversCount"]
             servers_running: int = cluster["serversRunning"]
-            return servers_running == server_count
-    return False
+            if servers_running == server_count:
+                return "running"
+            return "stopped"
+    return "absent"
 
 
 def create_k3d_cluster(
@@ -85,6 +119,7 @@ def create_k3d_cluster(
     """
     logger.info("Creating local K3D cluster '%s'.", cluster_name)
     global_config_dir_path = zenml.io.utils.get_global_config_directory()
+    _invalidate_k3d_cluster_list_cache()
     subprocess.check_call(
         [
             "k3d",
@@ -106,18 +141,21 @@ def create_k3d_cluster(
 
 def start_k3d_cluster(cluster_name: str) -> None:
     """Starts a K3D cluster with the given name."""
+    _invalidate_k3d_cluster_list_cache()
     subprocess.check_call(["k3d", "cluster", "start", cluster_name])
     logger.info("Started local k3d cluster '%s'.", cluster_name)
 
 
 def stop_k3d_cluster(cluster_name: str) -> None:
     """Stops a K3D cluster with the given name."""
+    _invalidate_k3d_cluster_list_cache()
     subprocess.check_call(["k3d", "cluster", "stop", cluster_name])
     logger.info("Stopped local k3d cluster '%s'.", cluster_name)
 
 
 def delete_k3d_cluster(cluster_name: str) -> None:
     """Deletes a K3D cluster with the given name."""
+    _invalidate_k3d_cluster_list_cache()
     subprocess.check_call(["k3d", "cluster", "delete", cluster_name])
     logger.info("Deleted local k3d cluster '%s'.", cluster_name)
 
@@ -35,6 +35,3 @@ class MlflowIntegration(Integration):
         from zenml.integrations.mlflow import experiment_trackers  # noqa
         from zenml.integrations.mlflow import model_deployers  # noqa
         from zenml.integrations.mlflow import services  # noqa
-
-
-MlflowIntegration.check_installation()
@@ -27,6 +27,3 @@ class NeuralProphetIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.neural_prophet import materializers  # noqa
-
-
-NeuralProphetIntegration.check_installation()
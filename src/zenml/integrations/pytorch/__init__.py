@@ -27,6 +27,3 @@ class PytorchIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.pytorch import materializers  # noqa
-
-
-PytorchIntegration.check_installation()
@@ -25,6 +25,3 @@ class PytorchLightningIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.pytorch_lightning import materializers  # noqa
-
-
-PytorchLightningIntegration.check_installation()
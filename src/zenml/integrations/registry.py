@@ -12,7 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
 
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
@@ -29,6 +29,7 @@ class IntegrationRegistry(object):
     def __init__(self) -> None:
         """Initializing the integration registry"""
         self._integrations: Dict[str, Type["Integration"]] = {}
+        self._activated_integrations: Set[str] = set()
 
     @property
     def integrations(self) -> Dict[str, Type["Integration"]]:
@@ -54,13 +55,22 @@ class IntegrationRegistry(object):
     ) -> None:
         """Method to register an integration with a given name"""
         self._integrations[key] = type_
+        # a newly registered integration class needs to be activated again
+        self._activated_integrations.discard(key)
 
     def activate_integrations(self) -> None:
         """Method to activate the integrations with are registered in the
-        registry"""
+        registry.
+
+        Integrations that were already activated are skipped, so calling
+        this method multiple times is cheap.
+        """
         for name, integration in self._integrations.items():
-            if integration.check_installation():
+            if name in self._activated_integrations:
+                continue
+            if integration.ensure_installed():
                 integration.activate()
+                self._activated_integrations.add(name)
                 logger.debug(f"Integration `{name}` is activated.")
             else:
                 logger.debug(f"Integration `{name}` could not be activated.")
@@ -91,16 +101,24 @@ class IntegrationRegistry(object):
                 for requirement in self._integrations[name].REQUIREMENTS
             ]
 
+    def verify_all(self) -> Dict[str, bool]:
+        """Checks the installation of all registered integrations.
+
+        Returns:
+            A dict mapping each integration name to whether all its
+            requirements are installed.
+        """
+        return {
+            name: integration.check_installation()
+            for name, integration in self._integrations.items()
+        }
+
     def is_installed(self, integration_name: Optional[str] = None) -> bool:
         """Checks if all requirements for an integration are installed"""
         if integration_name in self.list_integration_names:
             return self._integrations[integration_name].check_installation()
         elif not integration_name:
-            all_installed = [
-                self._integrations[item].check_installation()
-                for item in self.list_integration_names
-            ]
-            return all(all_installed)
+            return all(self.verify_all().values())
         else:
             raise KeyError(
                 f"Integration '{integration_name}' not found. "
@@ -29,6 +29,3 @@ class S3Integration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.s3 import artifact_stores  # noqa
-
-
-S3Integration.check_installation()
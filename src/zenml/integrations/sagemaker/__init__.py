@@ -30,6 +30,3 @@ class SagemakerIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.sagemaker import step_operators  # noqa
-
-
-SagemakerIntegration.check_installation()
@@ -33,6 +33,3 @@ class SeldonIntegration(Integration):
         from zenml.integrations.seldon import model_deployers  # noqa
         from zenml.integrations.seldon import secret_schemas  # noqa
         from zenml.integrations.seldon import services  # noqa
-
-
-SeldonIntegration.check_installation()
@@ -25,6 +25,3 @@ class SklearnIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.sklearn import materializers  # noqa
-
-
-SklearnIntegration.check_installation()
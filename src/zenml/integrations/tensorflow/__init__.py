@@ -30,6 +30,3 @@ class TensorflowIntegration(Integration):
 
         from zenml.integrations.tensorflow import materializers  # noqa
         from zenml.integrations.tensorflow import services  # noqa
-
-
-TensorflowIntegration.check_installation()
@@ -30,6 +30,3 @@ class VertexIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.vertex import step_operators  # noqa
-
-
-VertexIntegration.check_installation()
@@ -29,6 +29,3 @@ class WandbIntegration(Integration):
     def activate() -> None:
         """Activate the Wandb integration."""
         from zenml.integrations.wandb import experiment_trackers  # noqa
-
-
-WandbIntegration.check_installation()
@@ -27,6 +27,3 @@ class WhylogsIntegration(Integration):
         """Activates the integration."""
         from zenml.integrations.whylogs import materializers  # noqa
         from zenml.integrations.whylogs import visualizers  # noqa
-
-
-WhylogsIntegration.check_installation()
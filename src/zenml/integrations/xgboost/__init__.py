@@ -25,6 +25,3 @@ class XgboostIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.xgboost import materializers  # noqa
-
-
-XgboostIntegration.check_installation()
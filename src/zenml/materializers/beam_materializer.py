@@ -41,7 +41,6 @@ class BeamMaterializer(BaseMaterializer):
         """
         # TODO [ENG-139]: Implement beam writing
         super().handle_return(pipeline)
-        pipeline | beam.ParDo()
         pipeline.run()
         # pipeline | beam.io.WriteToParquet(self.artifact.uri)
         # pipeline.run()
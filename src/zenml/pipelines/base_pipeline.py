@@ -394,7 +394,7 @@ class BasePipeline(metaclass=BasePipelineMeta):
         Returns:
             The pipeline object that this method was called on.
         """
-        config_yaml = yaml_utils.read_yaml(config_file)
+        config_yaml = yaml_utils.read_yaml_cached(config_file)
 
         if PipelineConfigurationKeys.STEPS in config_yaml:
             self._read_config_steps(
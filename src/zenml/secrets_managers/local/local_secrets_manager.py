@@ -18,7 +18,6 @@ from typing import Any, ClassVar, Dict, List
 
 from pydantic import root_validator
 
-from zenml.cli.utils import error
 from zenml.constants import LOCAL_SECRETS_FILENAME, LOCAL_STORES_DIRECTORY_NAME
 from zenml.io.fileio import remove
 from zenml.io.utils import (
@@ -81,21 +80,6 @@ class LocalSecretsManager(BaseSecretsManager):
         """Makes sure the secrets yaml file exists"""
         create_file_if_not_exists(self.secrets_file)
 
-    def _verify_secret_key_exists(self, secret_name: str) -> bool:
-        """Checks if a secret key exists.
-
-        Args:
-            secret_name: The name of the secret key.
-
-        Returns:
-            True if the secret key exists, False otherwise."""
-        self._create_secrets_file__if_not_exists()
-        secrets_store_items = yaml_utils.read_yaml(self.secrets_file)
-        try:
-            return secret_name in secrets_store_items
-        except TypeError:
-            return False
-
     def _get_all_secrets(self) -> Dict[str, Dict[str, str]]:
         self._create_secrets_file__if_not_exists()
         return yaml_utils.read_yaml(self.secrets_file) or {}
@@ -108,15 +92,12 @@ class LocalSecretsManager(BaseSecretsManager):
 
         Raises:
             KeyError: If the secret already exists."""
-        self._create_secrets_file__if_not_exists()
-
-        if self._verify_secret_key_exists(secret_name=secret.name):
+        secrets_store_items = self._get_all_secrets()
+        if secret.name in secrets_store_items:
             raise KeyError(f"Secret `{secret.name}` already exists.")
-        encoded_secret = encode_secret(secret)
 
-        secrets_store_items = self._get_all_secrets()
-        secrets_store_items[secret.name] = encoded_secret
-        yaml_utils.append_yaml(self.secrets_file, secrets_store_items)
+        secrets_store_items[secret.name] = encode_secret(secret)
+        yaml_utils.write_yaml(self.secrets_file, secrets_store_items)
 
     def get_secret(self, secret_name: str) -> BaseSecretSchema:
         """Gets a specific secret.
@@ -129,12 +110,9 @@ class LocalSecretsManager(BaseSecretsManager):
 
         Raises:
             KeyError: If the secret does not exist."""
-        self._create_secrets_file__if_not_exists()
-
-        secret_store_items = self._get_all_secrets()
-        if not self._verify_secret_key_exists(secret_name=secret_name):
+        secret_dict = self._get_all_secrets().get(secret_name)
+        if secret_dict is None:
             raise KeyError(f"Secret `{secret_name}` does not exists.")
-        secret_dict = secret_store_items[secret_name]
 
         decoded_secret_dict, zenml_schema_name = decode_secret_dict(secret_dict)
         decoded_secret_dict["name"] = secret_name
@@ -149,8 +127,6 @@ class LocalSecretsManager(BaseSecretsManager):
 
         Returns:
             A list of all secret keys."""
-        self._create_secrets_file__if_not_exists()
-
         secrets_store_items = self._get_all_secrets()
         return list(secrets_store_items.keys())
 
@@ -162,15 +138,12 @@ class LocalSecretsManager(BaseSecretsManager):
 
         Raises:
             KeyError: If the secret does not exist."""
-        self._create_secrets_file__if_not_exists()
-
-        if not self._verify_secret_key_exists(secret_name=secret.name):
+        secrets_store_items = self._get_all_secrets()
+        if secret.name not in secrets_store_items:
             raise KeyError(f"Secret `{secret.name}` did not exist.")
-        encoded_secret = encode_secret(secret)
 
-        secrets_store_items = self._get_all_secrets()
-        secrets_store_items[secret.name] = encoded_secret
-        yaml_utils.append_yaml(self.secrets_file, secrets_store_items)
+        secrets_store_items[secret.name] = encode_secret(secret)
+        yaml_utils.write_yaml(self.secrets_file, secrets_store_items)
 
     def delete_secret(self, secret_name: str) -> None:
         """Delete an existing secret.
@@ -180,17 +153,11 @@ class LocalSecretsManager(BaseSecretsManager):
 
         Raises:
             KeyError: If the secret does not exist."""
-        self._create_secrets_file__if_not_exists()
-
-        if not self._verify_secret_key_exists(secret_name=secret_name):
-            raise KeyError(f"Secret `{secret_name}` does not exists.")
         secrets_store_items = self._get_all_secrets()
+        if secrets_store_items.pop(secret_name, None) is None:
+            raise KeyError(f"Secret `{secret_name}` does not exists.")
 
-        try:
-            secrets_store_items.pop(secret_name)
-            yaml_utils.write_yaml(self.secrets_file, secrets_store_items)
-        except KeyError:
-            error(f"Secret {secret_name} does not exist.")
+        yaml_utils.write_yaml(self.secrets_file, secrets_store_items)
 
     def delete_all_secrets(self, force: bool = False) -> None:
         """Delete all existing secrets.
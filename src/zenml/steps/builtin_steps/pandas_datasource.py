@@ -11,7 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 import pandas as pd
 
@@ -20,19 +20,31 @@ from zenml.steps.step_interfaces.base_datasource_step import (
     BaseDatasourceStep,
 )
 
+# File suffixes for which the datasource reads the columnar Parquet format
+# instead of parsing the file as CSV
+PARQUET_FILE_SUFFIXES = (".parquet", ".parquet.gzip", ".pq")
+
 
 class PandasDatasourceConfig(BaseDatasourceConfig):
-    """Config class for the pandas csv datasource"""
+    """Config class for the pandas csv datasource
+
+    The csv specific options (`sep`, `header`, `names`, `index_col`, `dtype`
+    and `engine`) are ignored if `path` points to a Parquet file.
+    """
 
     path: str
     sep: str = ","
     header: Union[int, List[int], str] = "infer"
     names: Optional[List[str]] = None
     index_col: Optional[Union[int, str, List[Union[int, str]], bool]] = None
+    dtype: Optional[Dict[str, str]] = None
+    usecols: Optional[List[str]] = None
+    engine: Optional[str] = None
 
 
 class PandasDatasource(BaseDatasourceStep):
-    """Simple step implementation to ingest from a csv file using pandas"""
+    """Simple step implementation to ingest from a csv or parquet file using
+    pandas"""
 
     def entrypoint(  # type: ignore[override]
         self,
@@ -44,10 +56,18 @@ class PandasDatasource(BaseDatasourceStep):
         Returns:
             the resulting dataframe
         """
+        if config.path.endswith(PARQUET_FILE_SUFFIXES):
+            # Parquet is columnar and already typed, which avoids parsing
+            # and type inference of the whole file as done for csv files
+            return pd.read_parquet(config.path, columns=config.usecols)
+
         return pd.read_csv(
             filepath_or_buffer=config.path,
             sep=config.sep,
             header=config.header,
             names=config.names,
             index_col=config.index_col,
+            dtype=config.dtype,
+            usecols=config.usecols,
+            engine=config.engine,
         )
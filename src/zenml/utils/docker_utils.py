@@ -18,6 +18,7 @@ from typing import AbstractSet, Any, Dict, Iterable, List, Optional, cast
 import pkg_resources
 from docker.client import DockerClient
 from docker.utils import build as docker_build_utils
+from docker.utils import parse_repository_tag
 
 import zenml
 from zenml.config.global_config import GlobalConfiguration
@@ -283,18 +284,31 @@ def build_docker_image(
     logger.info("Finished building docker image.")
 
 
-def push_docker_image(image_name: str) -> None:
+def push_docker_image(image_name: str) -> Optional[str]:
     """Pushes a docker image to a container registry.
 
     Args:
         image_name: The full name (including a tag) of the image to push.
+
+    Returns:
+        The repo digest of the pushed image if the registry reported it,
+        `None` otherwise.
     """
     logger.info("Pushing docker image '%s'.", image_name)
     docker_client = DockerClient.from_env()
     output_stream = docker_client.images.push(image_name, stream=True)
-    _process_stream(output_stream)
+    aux_info = _process_stream(output_stream)
     logger.info("Finished pushing docker image.")
 
+    digest = aux_info.get("Digest")
+    if not digest:
+        return None
+
+    # repo digests have the format `<REPOSITORY>@<DIGEST>`, same as the values
+    # returned by `get_image_digest(...)`
+    repository, _ = parse_repository_tag(image_name)
+    return f"{repository}@{digest}"
+
 
 def get_image_digest(image_name: str) -> Optional[str]:
     """Gets the digest of a docker image.
@@ -334,14 +348,18 @@ def is_local_image(image_name: str) -> bool:
         return False
 
 
-def _process_stream(stream: Iterable[bytes]) -> None:
+def _process_stream(stream: Iterable[bytes]) -> Dict[str, Any]:
     """Processes the output stream of a docker command call.
 
+    Returns:
+        The auxiliary information (e.g. the digest of a pushed image) that
+        was sent as part of the stream.
+
     Raises:
         JSONDecodeError: If a line in the stream is not json decodable.
         RuntimeError: If there was an error while running the docker command.
     """
-
+    aux_info: Dict[str, Any] = {}
     for element in stream:
         lines = element.decode("utf-8").strip().split("\n")
 
@@ -352,9 +370,13 @@ def _process_stream(stream: Iterable[bytes]) -> None:
                     raise RuntimeError(f"Docker error: {line_json['error']}.")
                 elif "stream" in line_json:
                     logger.info(line_json["stream"].strip())
+                elif "aux" in line_json:
+                    aux_info.update(line_json["aux"])
                 else:
                     pass
             except json.JSONDecodeError as error:
                 logger.warning(
                     "Failed to decode json for line '%s': %s", line, error
                 )
+
+    return aux_info
@@ -27,8 +27,7 @@ def encode_string(string: str) -> str:
     Returns:
         Encoded string
     """
-    encoded_bytes = base64.b64encode(string.encode("utf-8"))
-    return str(encoded_bytes, "utf-8")
+    return base64.b64encode(string.encode("utf-8")).decode("ascii")
 
 
 def encode_secret(secret: BaseSecretSchema) -> Dict[str, str]:
@@ -58,8 +57,7 @@ def decode_string(string: str) -> str:
     Returns:
         Decoded string
     """
-    decoded_bytes = base64.b64decode(string)
-    return str(decoded_bytes, "utf-8")
+    return base64.b64decode(string).decode("utf-8")
 
 
 def decode_secret_dict(
@@ -461,7 +461,13 @@ def import_python_file(file_path: str) -> types.ModuleType:
     """
     # Add directory of python file to PYTHONPATH so we can import it
     file_path = os.path.abspath(file_path)
-    sys.path.append(os.path.dirname(file_path))
-
+    file_directory = os.path.dirname(file_path)
+    # don't add duplicate entries, every import has to scan the entire
+    # `sys.path` for modules that aren't loaded yet
+    if file_directory not in sys.path:
+        sys.path.append(file_directory)
+
+    # `importlib.import_module` returns the module from `sys.modules` if it was
+    # already imported, so the file is only executed once per process
     module_name = os.path.splitext(os.path.basename(file_path))[0]
     return importlib.import_module(module_name)
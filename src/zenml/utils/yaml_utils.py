@@ -12,15 +12,29 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import copy
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from uuid import UUID
 
 import yaml
 
 from zenml.io import fileio, utils
 
+try:
+    # the libyaml based loader is considerably faster than the pure python
+    # implementation, but only available if PyYAML was built with libyaml
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[misc]
+
+# Parsed contents of local YAML files read by `read_yaml_cached`, keyed by the
+# absolute file path. Each entry also stores the modification time and size
+# of the file when it was parsed to detect changes.
+_yaml_cache: Dict[str, Tuple[int, int, Any]] = {}
+
 
 def write_yaml(file_path: str, contents: Dict[Any, Any]) -> None:
     """Write contents as YAML format to file_path.
@@ -67,11 +81,47 @@ def read_yaml(file_path: str) -> Any:
         contents = utils.read_file_contents_as_string(file_path)
         # TODO: [LOW] consider adding a default empty dict to be returned
         #   instead of None
-        return yaml.safe_load(contents)
+        return yaml.load(contents, Loader=SafeLoader)
     else:
         raise FileNotFoundError(f"{file_path} does not exist.")
 
 
+def read_yaml_cached(file_path: str) -> Any:
+    """Read YAML on file path and cache the parsed contents.
+
+    Reading an unchanged local file again returns a copy of the previously
+    parsed contents instead of parsing the file again. Remote files are not
+    cached.
+
+    Args:
+        file_path: Path to YAML file.
+
+    Returns:
+        Contents of the file in a dict.
+
+    Raises:
+        FileNotFoundError: if file does not exist.
+    """
+    if utils.is_remote(file_path):
+        return read_yaml(file_path)
+
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{file_path} does not exist.") from None
+
+    abs_path = os.path.abspath(file_path)
+    cached = _yaml_cache.get(abs_path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        contents = cached[2]
+    else:
+        contents = read_yaml(file_path)
+        _yaml_cache[abs_path] = (stat.st_mtime_ns, stat.st_size, contents)
+
+    # return a copy so callers can't modify the cached contents
+    return copy.deepcopy(contents)
+
+
 def is_yaml(file_path: str) -> bool:
     """Returns True if file_path is YAML, else False
 
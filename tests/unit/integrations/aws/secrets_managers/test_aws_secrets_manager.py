@@ -0,0 +1,69 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml.integrations.aws.secrets_managers import AWSSecretsManager
+
+
+@pytest.fixture
+def aws_client(mocker):
+    """Mocks the boto3 secrets manager client."""
+    return mocker.patch.object(AWSSecretsManager, "CLIENT")
+
+
+@pytest.mark.parametrize("force", [True, False])
+def test_delete_all_secrets(mocker, aws_client, force):
+    """Tests that deleting all secrets deletes each secret with the given
+    `force` flag."""
+    secret_names = [f"secret_{i}" for i in range(20)]
+    mocker.patch.object(
+        AWSSecretsManager, "get_all_secret_keys", return_value=secret_names
+    )
+
+    AWSSecretsManager(name="").delete_all_secrets(force=force)
+
+    assert aws_client.delete_secret.call_count == len(secret_names)
+    assert sorted(
+        call.kwargs["SecretId"]
+        for call in aws_client.delete_secret.call_args_list
+    ) == sorted(secret_names)
+    assert all(
+        call.kwargs["ForceDeleteWithoutRecovery"] is force
+        for call in aws_client.delete_secret.call_args_list
+    )
+
+
+def test_delete_all_secrets_without_secrets(mocker, aws_client):
+    """Tests that deleting all secrets doesn't send any delete requests if
+    there are no secrets."""
+    mocker.patch.object(
+        AWSSecretsManager, "get_all_secret_keys", return_value=[]
+    )
+
+    AWSSecretsManager(name="").delete_all_secrets()
+
+    aws_client.delete_secret.assert_not_called()
+
+
+def test_delete_all_secrets_raises_deletion_errors(mocker, aws_client):
+    """Tests that an error while deleting one of the secrets is raised."""
+    mocker.patch.object(
+        AWSSecretsManager,
+        "get_all_secret_keys",
+        return_value=["secret_1", "secret_2"],
+    )
+    aws_client.delete_secret.side_effect = [None, RuntimeError("failed")]
+
+    with pytest.raises(RuntimeError):
+        AWSSecretsManager(name="").delete_all_secrets()
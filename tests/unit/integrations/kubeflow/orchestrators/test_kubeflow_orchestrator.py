@@ -11,7 +11,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import threading
 from contextlib import ExitStack as does_not_raise
+from types import SimpleNamespace
+from uuid import uuid4
 
 import pytest
 
@@ -59,3 +62,153 @@ def test_kubeflow_orchestrator_stack_validation():
             artifact_store=artifact_store,
             container_registry=container_registry,
         ).validate()
+
+
+def test_kubeflow_orchestrator_defaults_to_local_kubernetes_context():
+    """Tests that the kubeflow orchestrator uses the context of the local k3d
+    cluster if no kubernetes context is configured."""
+    orchestrator = KubeflowOrchestrator(name="")
+
+    assert orchestrator.kubernetes_context is None
+    assert (
+        orchestrator.effective_kubernetes_context
+        == f"k3d-zenml-kubeflow-{str(orchestrator.uuid)[:8]}"
+    )
+    assert orchestrator.is_local
+
+
+def test_kubeflow_orchestrator_with_remote_kubernetes_context():
+    """Tests that the kubeflow orchestrator uses an explicitly configured
+    kubernetes context."""
+    orchestrator = KubeflowOrchestrator(
+        name="", kubernetes_context="remote_context"
+    )
+
+    assert orchestrator.effective_kubernetes_context == "remote_context"
+    assert not orchestrator.is_local
+
+
+def test_kubeflow_orchestrator_with_explicit_local_kubernetes_context():
+    """Tests that the kubeflow orchestrator is local if the configured
+    kubernetes context is the one of the local k3d cluster."""
+    uuid = uuid4()
+    local_context = f"k3d-zenml-kubeflow-{str(uuid)[:8]}"
+    orchestrator = KubeflowOrchestrator(
+        name="", uuid=uuid, kubernetes_context=local_context
+    )
+
+    assert orchestrator.effective_kubernetes_context == local_context
+    assert orchestrator.is_local
+
+
+def _run_detail(status):
+    """Creates a fake KFP run detail with the given status."""
+    return SimpleNamespace(run=SimpleNamespace(status=status))
+
+
+def _mock_clock(mocker):
+    """Patches `time.monotonic` and `time.sleep` with a fake clock that only
+    advances when sleeping. Returns the mocked `time.sleep`."""
+    clock = {"now": 0.0}
+
+    def _sleep(seconds):
+        clock["now"] += seconds
+
+    mocker.patch("time.monotonic", side_effect=lambda: clock["now"])
+    return mocker.patch("time.sleep", side_effect=_sleep)
+
+
+def test_wait_for_run_completion_returns_final_run(mocker):
+    """Tests that waiting for a run returns without sleeping if the run is
+    already finished."""
+    sleep = _mock_clock(mocker)
+    client = mocker.MagicMock()
+    client.get_run.return_value = _run_detail("Succeeded")
+
+    run_detail = KubeflowOrchestrator._wait_for_run_completion(
+        client=client, run_id="run_id", timeout=100
+    )
+
+    assert run_detail is client.get_run.return_value
+    client.get_run.assert_called_once_with(run_id="run_id")
+    sleep.assert_not_called()
+
+
+def test_wait_for_run_completion_polls_until_final_status(mocker):
+    """Tests that waiting for a run keeps polling with an increasing interval
+    while the run has no final status."""
+    sleep = _mock_clock(mocker)
+    client = mocker.MagicMock()
+    client.get_run.side_effect = [
+        _run_detail(None),
+        _run_detail("Running"),
+        _run_detail("Failed"),
+    ]
+
+    run_detail = KubeflowOrchestrator._wait_for_run_completion(
+        client=client, run_id="run_id", timeout=100
+    )
+
+    assert run_detail.run.status == "Failed"
+    assert client.get_run.call_count == 3
+    assert [call.args[0] for call in sleep.call_args_list] == [1.5, 2.25]
+
+
+def test_wait_for_run_completion_times_out(mocker):
+    """Tests that the polling interval is capped, doesn't exceed the deadline
+    and that a `TimeoutError` is raised once the timeout is reached."""
+    sleep = _mock_clock(mocker)
+    client = mocker.MagicMock()
+    client.get_run.return_value = _run_detail("Running")
+
+    with pytest.raises(TimeoutError):
+        KubeflowOrchestrator._wait_for_run_completion(
+            client=client, run_id="run_id", timeout=200
+        )
+
+    sleep_durations = [call.args[0] for call in sleep.call_args_list]
+    assert max(sleep_durations) == 30
+    assert sleep_durations[-1] < 30
+    assert sum(sleep_durations) == pytest.approx(200)
+
+
+def test_environment_vars_from_secrets_keep_secret_order(mocker):
+    """Tests that values of later secrets overwrite the ones of earlier
+    secrets even if the secrets are fetched out of order."""
+    second_secret_fetched = threading.Event()
+    secret_contents = {
+        "first": {"KEY": "first_value", "FIRST_KEY": "1"},
+        "second": {"KEY": "second_value", "SECOND_KEY": "2"},
+    }
+
+    def _get_secret(secret_name):
+        if secret_name == "first":
+            # make sure the first secret finishes after the second one
+            assert second_secret_fetched.wait(timeout=5)
+        else:
+            second_secret_fetched.set()
+        return SimpleNamespace(content=secret_contents[secret_name])
+
+    stack = mocker.MagicMock()
+    stack.secrets_manager.get_secret.side_effect = _get_secret
+
+    environment_vars = KubeflowOrchestrator(
+        name=""
+    )._get_environment_vars_from_secrets(["first", "second"], stack=stack)
+
+    assert environment_vars == {
+        "KEY": "second_value",
+        "FIRST_KEY": "1",
+        "SECOND_KEY": "2",
+    }
+
+
+def test_environment_vars_from_secrets_raise_fetching_errors(mocker):
+    """Tests that an error while fetching a secret is raised."""
+    stack = mocker.MagicMock()
+    stack.secrets_manager.get_secret.side_effect = KeyError("missing")
+
+    with pytest.raises(KeyError):
+        KubeflowOrchestrator(name="")._get_environment_vars_from_secrets(
+            ["missing", "other"], stack=stack
+        )
@@ -0,0 +1,102 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+
+import pytest
+
+from zenml.integrations.kubeflow.orchestrators import local_deployment_utils
+
+CLUSTER_LIST = [
+    {"name": "running-cluster", "serversCount": 1, "serversRunning": 1},
+    {"name": "stopped-cluster", "serversCount": 1, "serversRunning": 0},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_k3d_cluster_list_cache():
+    """Makes sure no cached `k3d cluster list` output leaks between tests."""
+    local_deployment_utils._invalidate_k3d_cluster_list_cache()
+    yield
+    local_deployment_utils._invalidate_k3d_cluster_list_cache()
+
+
+@pytest.fixture
+def check_output(mocker):
+    """Mocks the `k3d cluster list` subprocess call."""
+    return mocker.patch.object(
+        local_deployment_utils.subprocess,
+        "check_output",
+        return_value=json.dumps(CLUSTER_LIST).encode(),
+    )
+
+
+@pytest.mark.parametrize(
+    "cluster_name, expected_status",
+    [
+        ("running-cluster", "running"),
+        ("stopped-cluster", "stopped"),
+        ("missing-cluster", "absent"),
+    ],
+)
+def test_k3d_cluster_status(check_output, cluster_name, expected_status):
+    """Tests that the k3d cluster status is parsed correctly from the
+    `k3d cluster list` output."""
+    assert (
+        local_deployment_utils.k3d_cluster_status(cluster_name)
+        == expected_status
+    )
+
+
+def test_k3d_cluster_list_is_cached(mocker, check_output):
+    """Tests that the `k3d cluster list` output is reused within the cache
+    TTL and fetched again once it expired."""
+    monotonic = mocker.patch("time.monotonic", return_value=100.0)
+
+    local_deployment_utils.k3d_cluster_status("running-cluster")
+    local_deployment_utils.k3d_cluster_status("stopped-cluster")
+    assert check_output.call_count == 1
+
+    monotonic.return_value += local_deployment_utils.K3D_CLUSTER_LIST_CACHE_TTL
+    local_deployment_utils.k3d_cluster_status("running-cluster")
+    assert check_output.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "cluster_command",
+    [
+        lambda: local_deployment_utils.create_k3d_cluster(
+            cluster_name="cluster",
+            registry_name="registry",
+            registry_config_path="registry.yaml",
+        ),
+        lambda: local_deployment_utils.start_k3d_cluster("cluster"),
+        lambda: local_deployment_utils.stop_k3d_cluster("cluster"),
+        lambda: local_deployment_utils.delete_k3d_cluster("cluster"),
+    ],
+    ids=["create", "start", "stop", "delete"],
+)
+def test_k3d_cluster_commands_invalidate_cache(
+    mocker, check_output, cluster_command
+):
+    """Tests that changing the state of a k3d cluster invalidates the cached
+    `k3d cluster list` output."""
+    mocker.patch("time.monotonic", return_value=100.0)
+    mocker.patch.object(local_deployment_utils.subprocess, "check_call")
+
+    local_deployment_utils.k3d_cluster_status("cluster")
+    assert check_output.call_count == 1
+
+    cluster_command()
+    local_deployment_utils.k3d_cluster_status("cluster")
+    assert check_output.call_count == 2
@@ -0,0 +1,78 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml.integrations.integration import Integration
+from zenml.integrations.registry import integration_registry
+
+
+@pytest.fixture
+def integration_classes():
+    """Creates a parent and child integration class and removes them from
+    the integration registry afterwards."""
+
+    class ParentIntegration(Integration):
+        NAME = "parent_test_integration"
+
+    class ChildIntegration(ParentIntegration):
+        NAME = "child_test_integration"
+
+    yield ParentIntegration, ChildIntegration
+
+    for integration in (ParentIntegration, ChildIntegration):
+        integration_registry.integrations.pop(integration.NAME)
+
+
+def test_ensure_installed_caches_installation_check(
+    mocker, integration_classes
+):
+    """Tests that `ensure_installed()` only checks the installation once."""
+    integration, _ = integration_classes
+    check_installation = mocker.patch.object(
+        integration, "check_installation", return_value=True
+    )
+
+    assert integration.ensure_installed()
+    assert integration.ensure_installed()
+    check_installation.assert_called_once()
+
+
+def test_ensure_installed_is_cached_per_class(mocker, integration_classes):
+    """Tests that a subclass doesn't use the cached installation check of
+    its parent integration."""
+    parent, child = integration_classes
+    mocker.patch.object(parent, "check_installation", return_value=True)
+    assert parent.ensure_installed()
+
+    child_check_installation = mocker.patch.object(
+        child, "check_installation", return_value=False
+    )
+    assert not child.ensure_installed()
+    child_check_installation.assert_called_once()
+
+
+def test_is_installed_bypasses_cached_installation_check(
+    mocker, integration_classes
+):
+    """Tests that the integration registry always checks the installation
+    when explicitly asked whether an integration is installed."""
+    integration, _ = integration_classes
+    check_installation = mocker.patch.object(
+        integration, "check_installation", return_value=True
+    )
+    integration.ensure_installed()
+
+    assert integration_registry.is_installed(integration.NAME)
+    assert integration_registry.is_installed(integration.NAME)
+    assert check_installation.call_count == 3
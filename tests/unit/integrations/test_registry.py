@@ -0,0 +1,64 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from zenml.integrations.registry import IntegrationRegistry
+
+
+def _fake_integration(mocker, installed=True):
+    """Creates a fake integration class with mocked installation check and
+    activation."""
+    integration = mocker.MagicMock()
+    integration.ensure_installed.return_value = installed
+    return integration
+
+
+def test_activate_integrations_only_activates_once(mocker):
+    """Tests that repeatedly activating the integrations only activates each
+    integration once."""
+    registry = IntegrationRegistry()
+    integration = _fake_integration(mocker)
+    registry.register_integration("fake", integration)
+
+    registry.activate_integrations()
+    registry.activate_integrations()
+
+    integration.activate.assert_called_once()
+
+
+def test_registering_integration_again_requires_new_activation(mocker):
+    """Tests that an integration is activated again after it was registered
+    again under the same name."""
+    registry = IntegrationRegistry()
+    integration = _fake_integration(mocker)
+    registry.register_integration("fake", integration)
+    registry.activate_integrations()
+
+    new_integration = _fake_integration(mocker)
+    registry.register_integration("fake", new_integration)
+    registry.activate_integrations()
+
+    integration.activate.assert_called_once()
+    new_integration.activate.assert_called_once()
+
+
+def test_activate_integrations_skips_missing_integrations(mocker):
+    """Tests that integrations which are not installed don't get
+    activated."""
+    registry = IntegrationRegistry()
+    integration = _fake_integration(mocker, installed=False)
+    registry.register_integration("fake", integration)
+
+    registry.activate_integrations()
+    registry.activate_integrations()
+
+    integration.activate.assert_not_called()
@@ -0,0 +1,59 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pandas as pd
+import pytest
+
+from zenml.steps.builtin_steps import PandasDatasource, PandasDatasourceConfig
+
+
+@pytest.fixture
+def dataframe():
+    """Returns a small dataframe to write to csv and parquet files."""
+    return pd.DataFrame(
+        {"id": [1, 2, 3], "fare": [1.5, 2.5, 3.5], "vendor": ["a", "b", "a"]}
+    )
+
+
+def test_pandas_datasource_reads_csv_columns_and_dtypes(tmp_path, dataframe):
+    """Tests that the pandas datasource only reads the selected csv columns
+    with the given dtypes."""
+    path = str(tmp_path / "data.csv")
+    dataframe.to_csv(path, index=False)
+
+    config = PandasDatasourceConfig(
+        path=path,
+        usecols=["fare", "vendor"],
+        dtype={"fare": "float32", "vendor": "category"},
+    )
+    result = PandasDatasource().entrypoint(config=config)
+
+    assert list(result.columns) == ["fare", "vendor"]
+    assert result["fare"].dtype == "float32"
+    assert result["vendor"].dtype == "category"
+    assert result["fare"].tolist() == [1.5, 2.5, 3.5]
+
+
+def test_pandas_datasource_reads_parquet_columns(tmp_path, dataframe):
+    """Tests that the pandas datasource reads parquet files and only loads
+    the selected columns."""
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "data.parquet")
+    dataframe.to_parquet(path, index=False)
+
+    config = PandasDatasourceConfig(path=path, usecols=["id", "vendor"])
+    result = PandasDatasource().entrypoint(config=config)
+
+    assert list(result.columns) == ["id", "vendor"]
+    assert result["id"].dtype == "int64"
+    assert result["vendor"].tolist() == ["a", "b", "a"]
@@ -0,0 +1,82 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+
+import pytest
+
+from zenml.utils import docker_utils
+
+DIGEST = "sha256:" + "a" * 64
+
+
+def _push_stream(include_digest: bool):
+    """Creates a fake output stream of a docker push call."""
+    lines = [
+        {"status": "The push refers to repository [localhost:5000/img]"},
+        {"status": "Pushed", "progressDetail": {}, "id": "0123456789ab"},
+        {"status": f"tag: digest: {DIGEST} size: 1234"},
+    ]
+    if include_digest:
+        lines.append(
+            {
+                "progressDetail": {},
+                "aux": {"Tag": "tag", "Digest": DIGEST, "Size": 1234},
+            }
+        )
+    # multiple json lines can be part of the same stream element
+    return [
+        json.dumps(lines[0]).encode(),
+        "\r\n".join(json.dumps(line) for line in lines[1:]).encode(),
+    ]
+
+
+@pytest.mark.parametrize(
+    "image_name, repository",
+    [
+        ("localhost:5000/img:tag", "localhost:5000/img"),
+        ("gcr.io/project/img:tag", "gcr.io/project/img"),
+        ("img", "img"),
+    ],
+)
+def test_push_docker_image_returns_repo_digest(mocker, image_name, repository):
+    """Tests that pushing a docker image returns the repo digest reported in
+    the push output stream."""
+    docker_client = mocker.patch.object(
+        docker_utils.DockerClient, "from_env"
+    ).return_value
+    docker_client.images.push.return_value = _push_stream(include_digest=True)
+
+    assert (
+        docker_utils.push_docker_image(image_name) == f"{repository}@{DIGEST}"
+    )
+    docker_client.images.push.assert_called_once_with(image_name, stream=True)
+
+
+def test_push_docker_image_without_digest(mocker):
+    """Tests that pushing a docker image returns `None` if the push output
+    stream doesn't contain a digest."""
+    docker_client = mocker.patch.object(
+        docker_utils.DockerClient, "from_env"
+    ).return_value
+    docker_client.images.push.return_value = _push_stream(include_digest=False)
+
+    assert docker_utils.push_docker_image("localhost:5000/img:tag") is None
+
+
+def test_process_stream_raises_on_docker_errors():
+    """Tests that errors in a docker output stream are raised."""
+    stream = [json.dumps({"error": "denied"}).encode()]
+
+    with pytest.raises(RuntimeError):
+        docker_utils._process_stream(stream)
@@ -11,3 +11,34 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+
+import os
+
+from zenml.utils import yaml_utils
+
+
+def test_read_yaml_cached_returns_copies(tmp_path) -> None:
+    """Check that `read_yaml_cached` returns copies of the cached contents."""
+    file_path = str(tmp_path / "config.yaml")
+    yaml_utils.write_yaml(file_path, {"steps": {"trainer": {"epochs": 1}}})
+
+    contents = yaml_utils.read_yaml_cached(file_path)
+    contents["steps"]["trainer"]["epochs"] = 5
+
+    assert yaml_utils.read_yaml_cached(file_path) == {
+        "steps": {"trainer": {"epochs": 1}}
+    }
+
+
+def test_read_yaml_cached_detects_file_changes(tmp_path) -> None:
+    """Check that `read_yaml_cached` parses the file again if it changed."""
+    file_path = str(tmp_path / "config.yaml")
+    yaml_utils.write_yaml(file_path, {"name": "pipeline"})
+    assert yaml_utils.read_yaml_cached(file_path) == {"name": "pipeline"}
+
+    yaml_utils.write_yaml(file_path, {"name": "other_pipeline"})
+    # make sure the modification time differs even on coarse filesystems
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert yaml_utils.read_yaml_cached(file_path) == {"name": "other_pipeline"}